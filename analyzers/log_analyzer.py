@@ -7,6 +7,7 @@ Calculates metrics, identifies patterns, and generates recommendations.
 from __future__ import annotations
 
 import sys
+from collections import Counter, defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -128,8 +129,9 @@ class LogAnalysis:
         if not self.first_entry_time or not self.last_entry_time:
             return None
         try:
-            start = datetime.fromisoformat(self.first_entry_time.replace("Z", "+00:00"))
-            end = datetime.fromisoformat(self.last_entry_time.replace("Z", "+00:00"))
+            # fromisoformat accepts the Z suffix directly on Python 3.11+
+            start = datetime.fromisoformat(self.first_entry_time)
+            end = datetime.fromisoformat(self.last_entry_time)
             return (end - start).total_seconds() / 60
         except (ValueError, TypeError):
             return None
@@ -154,11 +156,14 @@ def analyze_log(project_dir: str) -> LogAnalysis | None:
     analysis.total_entries = len(entries)
 
     # Track sessions
-    sessions: dict[str, list[LogEntry]] = {}
+    sessions: defaultdict[str, list[LogEntry]] = defaultdict(list)
 
     # Track prompt lengths for user inputs
     prompt_lengths: list[int] = []
 
+    # Track command frequency
+    command_counts: Counter[str] = Counter()
+
     # Process each entry
     for entry in entries:
         # Count by type
@@ -177,9 +182,7 @@ def analyze_log(project_dir: str) -> LogAnalysis | None:
 
         # Track commands
         if entry.command:
-            analysis.commands_used[entry.command] = (
-                analysis.commands_used.get(entry.command, 0) + 1
-            )
+            command_counts[entry.command] += 1
 
         # Track filtered content (secrets only - no profanity filtering in this plugin)
         if entry.filter_applied and entry.filter_applied.secret_count > 0:
@@ -188,10 +191,10 @@ def analyze_log(project_dir: str) -> LogAnalysis | None:
 
         # Group by session, use "unknown" for missing/empty session_id
         session_key = entry.session_id if entry.session_id else "unknown"
-        if session_key not in sessions:
-            sessions[session_key] = []
         sessions[session_key].append(entry)
 
+    analysis.commands_used = dict(command_counts)
+
     # Calculate prompt length stats
     if prompt_lengths:
         analysis.prompt_length_min = min(prompt_lengths)
@@ -206,29 +209,30 @@ def analyze_log(project_dir: str) -> LogAnalysis | None:
         )
 
     for session_id, session_entries in sessions.items():
-        session_questions = sum(
-            1
-            for e in session_entries
-            if "?" in e.content and e.entry_type == "user_input"
-        )
-        session_filtered = len(
-            [
-                e
-                for e in session_entries
-                if e.filter_applied and e.filter_applied.secret_count > 0
-            ],
-        )
+        # Single pass per session instead of one generator pass per counter
+        session_user_inputs = 0
+        session_expanded = 0
+        session_summaries = 0
+        session_questions = 0
+        session_filtered = 0
+        for e in session_entries:
+            if e.entry_type == "user_input":
+                session_user_inputs += 1
+                if "?" in e.content:
+                    session_questions += 1
+            elif e.entry_type == "expanded_prompt":
+                session_expanded += 1
+            elif e.entry_type == "response_summary":
+                session_summaries += 1
+            if e.filter_applied and e.filter_applied.secret_count > 0:
+                session_filtered += 1
 
         stats = SessionStats(
             session_id=session_id,
             entry_count=len(session_entries),
-            user_inputs=sum(1 for e in session_entries if e.entry_type == "user_input"),
-            expanded_prompts=sum(
-                1 for e in session_entries if e.entry_type == "expanded_prompt"
-            ),
-            response_summaries=sum(
-                1 for e in session_entries if e.entry_type == "response_summary"
-            ),
+            user_inputs=session_user_inputs,
+            expanded_prompts=session_expanded,
+            response_summaries=session_summaries,
             questions_asked=session_questions,
             filtered_content=session_filtered,
             start_time=session_entries[0].timestamp if session_entries else None,
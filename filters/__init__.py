@@ -6,7 +6,7 @@ secret detection and content truncation.
 Modules:
     pipeline: Filter orchestration and secret detection (filter_pipeline, FilterResult)
     log_entry: Data structures for log entries (LogEntry, FilterInfo, EntryMetadata)
-    log_writer: Atomic NDJSON append operations (append_to_log, read_log)
+    log_writer: Atomic NDJSON append operations (append_to_log, read_log, iter_log)
 
 Usage:
     from filters import filter_pipeline, FilterResult
@@ -24,7 +24,7 @@ Security Features:
 """
 
 from .log_entry import EntryMetadata, FilterInfo, LogEntry
-from .log_writer import append_to_log, get_log_path, read_log
+from .log_writer import append_to_log, get_log_path, iter_log, read_log
 from .pipeline import FilterResult, filter_pipeline
 
 __all__ = [
@@ -35,5 +35,6 @@ __all__ = [
     "EntryMetadata",
     "append_to_log",
     "read_log",
+    "iter_log",
     "get_log_path",
 ]
@@ -75,7 +75,7 @@ from datetime import UTC, datetime
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class FilterInfo:
     """Information about content filtering applied to an entry.
 
@@ -103,7 +103,7 @@ class FilterInfo:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class EntryMetadata:
     """Metadata about the log entry context.
 
@@ -128,7 +128,7 @@ class EntryMetadata:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class LogEntry:
     """
     A single entry in the prompt capture log.
@@ -104,11 +104,14 @@ Log files are stored at the project root:
 
 from __future__ import annotations
 
+import errno
 import fcntl
 import json
 import os
 import signal
 import sys
+from collections import deque
+from collections.abc import Iterator
 from pathlib import Path
 
 from .log_entry import LogEntry
@@ -261,8 +264,9 @@ def append_to_log(project_dir: str, entry: LogEntry) -> bool:
                 LOG_FILE_PERMISSIONS,
             )
         except OSError as e:
-            # If O_NOFOLLOW fails because path is symlink, this is a security issue
-            if "symbolic link" in str(e).lower() or e.errno == 40:  # ELOOP
+            # If O_NOFOLLOW fails because path is symlink, this is a security issue.
+            # Check the errno first so the message is only scanned as a fallback.
+            if e.errno == errno.ELOOP or "symbolic link" in str(e).lower():
                 sys.stderr.write(
                     f"claude-spec prompt_capture: Symlink attack prevented: {e}\n",
                 )
@@ -308,24 +312,27 @@ def append_to_log(project_dir: str, entry: LogEntry) -> bool:
         return False
 
 
-def read_log(project_dir: str) -> list[LogEntry]:
+def iter_log(project_dir: str) -> Iterator[LogEntry]:
     """
-    Read all entries from the prompt log.
+    Stream entries from the prompt log one line at a time.
+
+    Entries are yielded as each line is parsed, so callers that only
+    aggregate or keep a window of entries never hold the whole log in memory.
 
     Args:
         project_dir: Path to the spec project directory
 
-    Returns:
-        List of LogEntry objects, empty list if file doesn't exist or errors
+    Yields:
+        LogEntry objects in file order; nothing if file doesn't exist or errors
     """
     try:
         log_path = get_log_path(project_dir)
     except PathTraversalError as e:
         sys.stderr.write(f"claude-spec prompt_capture: Security error: {e}\n")
-        return []
+        return
 
     if not log_path.is_file():
-        return []
+        return
 
     # Security: Check for symlink attacks before reading
     if not _check_symlink_safety(log_path):
@@ -333,9 +340,7 @@ def read_log(project_dir: str) -> list[LogEntry]:
             f"claude-spec prompt_capture: Symlink detected at {log_path}, "
             "refusing to read\n",
         )
-        return []
-
-    entries = []
+        return
 
     try:
         with log_path.open(encoding="utf-8") as f:
@@ -344,16 +349,29 @@ def read_log(project_dir: str) -> list[LogEntry]:
                 if not line:
                     continue
                 try:
-                    entries.append(LogEntry.from_json(line))
+                    entry = LogEntry.from_json(line)
                 except json.JSONDecodeError:
                     sys.stderr.write(
                         f"claude-spec prompt_capture: Skipping corrupted line "
                         f"{line_num} in {log_path}\n",
                     )
+                    continue
+                yield entry
     except OSError as e:
         sys.stderr.write(f"claude-spec prompt_capture: Error reading log: {e}\n")
 
-    return entries
+
+def read_log(project_dir: str) -> list[LogEntry]:
+    """
+    Read all entries from the prompt log.
+
+    Args:
+        project_dir: Path to the spec project directory
+
+    Returns:
+        List of LogEntry objects, empty list if file doesn't exist or errors
+    """
+    return list(iter_log(project_dir))
 
 
 def get_recent_entries(project_dir: str, count: int = 10) -> list[LogEntry]:
@@ -367,8 +385,8 @@ def get_recent_entries(project_dir: str, count: int = 10) -> list[LogEntry]:
     Returns:
         List of LogEntry objects (most recent last)
     """
-    entries = read_log(project_dir)
-    return entries[-count:] if entries else []
+    # Bounded window over the stream: O(count) memory regardless of log size
+    return list(deque(iter_log(project_dir), maxlen=max(count, 0)))
 
 
 def log_exists(project_dir: str) -> bool:
@@ -227,7 +227,8 @@ SECRET_PATTERNS: dict[str, Pattern[str]] = {
 }
 
 
-@dataclass
+# Allocated once per pattern match; slots keep the per-match footprint small
+@dataclass(slots=True)
 class SecretMatch:
     """Represents a detected secret in text.
 
@@ -341,18 +342,16 @@ def detect_secrets(text: str) -> list[SecretMatch]:
     Returns:
         List of SecretMatch objects for each detected secret
     """
-    matches = []
-
-    for secret_type, pattern in SECRET_PATTERNS.items():
-        for match in pattern.finditer(text):
-            matches.append(
-                SecretMatch(
-                    secret_type=secret_type,
-                    match=match.group(0),
-                    start=match.start(),
-                    end=match.end(),
-                ),
-            )
+    matches = [
+        SecretMatch(
+            secret_type=secret_type,
+            match=match.group(0),
+            start=match.start(),
+            end=match.end(),
+        )
+        for secret_type, pattern in SECRET_PATTERNS.items()
+        for match in pattern.finditer(text)
+    ]
 
     # Sort by position for consistent replacement
     matches.sort(key=lambda m: m.start)
@@ -408,8 +407,9 @@ def filter_secrets(text: str) -> tuple[str, list[str]]:
         result = result[: match.start] + placeholder + result[match.end :]
         secret_types.append(match.secret_type)
 
-    # Add any types found only in decoded content
-    decoded_only_types = [t for t in all_secret_types if t not in secret_types]
+    # Add any types found only in decoded content (set for O(1) membership)
+    replaced_types = set(secret_types)
+    decoded_only_types = [t for t in all_secret_types if t not in replaced_types]
     if decoded_only_types:
         secret_types.extend(decoded_only_types)
 
@@ -476,7 +476,9 @@ def quick_check(text: str) -> bool:
     """
     Quick check if text contains any sensitive content.
 
-    Useful for deciding whether to run full pipeline.
+    Useful for deciding whether to run full pipeline. Agrees with
+    ``filter_pipeline(text).was_filtered`` but stops at the first matching
+    pattern instead of collecting, sorting and replacing every match.
 
     Args:
         text: Text to check
@@ -484,5 +486,8 @@ def quick_check(text: str) -> bool:
     Returns:
         True if text likely contains sensitive content
     """
-    result = filter_pipeline(text)
-    return result.was_filtered
+    if len(text) > MAX_CONTENT_LENGTH:
+        return True
+
+    scan_text = decode_base64_segments(text)
+    return any(pattern.search(scan_text) for pattern in SECRET_PATTERNS.values())
@@ -122,6 +122,7 @@ Post-steps (run after command):
     - ``context_loader.py``: Load project context for session start
 """
 
+import sys
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import Enum
@@ -154,8 +155,6 @@ def safe_mtime(path: Path, context: str = "base") -> float:
     Returns:
         Modification time as float, or 0 on error.
     """
-    import sys
-
     try:
         return path.stat().st_mtime
     except OSError as e:
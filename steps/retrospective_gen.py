@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import json
 import sys
+from collections import Counter
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
@@ -109,31 +110,32 @@ class RetrospectiveGeneratorStep(BaseStep):
 
             # Basic statistics
             total_entries = len(entries)
-            commands_used: dict[str, int] = {}
-            timestamps: list[str] = []
+            commands_used: Counter[str] = Counter()
+            # Only the first and last timestamps are needed for the duration
+            first_ts: str | None = None
+            last_ts: str | None = None
+            timestamp_count = 0
 
             for entry in entries:
                 # Count commands
                 cmd = entry.get("command")
                 if cmd:
-                    commands_used[cmd] = commands_used.get(cmd, 0) + 1
+                    commands_used[cmd] += 1
 
-                # Collect timestamps
+                # Track timestamp bounds
                 ts = entry.get("timestamp")
                 if ts:
-                    timestamps.append(ts)
+                    if first_ts is None:
+                        first_ts = ts
+                    last_ts = ts
+                    timestamp_count += 1
 
             # Calculate duration if we have timestamps
             duration = None
-            if len(timestamps) >= 2:
+            if timestamp_count >= 2 and first_ts and last_ts:
                 try:
-                    # Handle both Zulu time (Z suffix) and explicit timezone offsets
-                    first_ts = timestamps[0]
-                    last_ts = timestamps[-1]
-                    if first_ts.endswith("Z"):
-                        first_ts = first_ts[:-1] + "+00:00"
-                    if last_ts.endswith("Z"):
-                        last_ts = last_ts[:-1] + "+00:00"
+                    # fromisoformat handles both Zulu time (Z suffix) and
+                    # explicit timezone offsets on Python 3.11+
                     first = datetime.fromisoformat(first_ts)
                     last = datetime.fromisoformat(last_ts)
                     duration = str(last - first)
@@ -144,7 +146,7 @@ class RetrospectiveGeneratorStep(BaseStep):
 
             return {
                 "total_prompts": total_entries,
-                "commands_used": commands_used,
+                "commands_used": dict(commands_used),
                 "duration": duration,
             }
 
@@ -174,24 +176,25 @@ class RetrospectiveGeneratorStep(BaseStep):
         project_summary = "No summary available"
         if readme_path.is_file():
             try:
-                readme = readme_path.read_text(encoding="utf-8")
-                # Extract first paragraph after # heading
-                lines = readme.split("\n")
-                in_content = False
-                for line in lines:
-                    if line.startswith("# "):
-                        in_content = True
-                        continue
-                    if in_content and line.strip() and not line.startswith("#"):
-                        project_summary = line.strip()
-                        break
+                # Extract first paragraph after # heading; stream lines so
+                # only the head of a long README is read
+                with readme_path.open(encoding="utf-8") as readme:
+                    in_content = False
+                    for line in readme:
+                        if line.startswith("# "):
+                            in_content = True
+                            continue
+                        if in_content and line.strip() and not line.startswith("#"):
+                            project_summary = line.strip()
+                            break
             except Exception as e:
                 sys.stderr.write(
                     f"retrospective_gen: Failed to read {readme_path}: {e}\n",
                 )
 
-        # Build retrospective content
-        content = f"""---
+        # Build retrospective content as parts joined once at the end
+        parts = [
+            f"""---
 document_type: retrospective
 project: {project_name}
 completed: {timestamp}
@@ -206,16 +209,17 @@ completed: {timestamp}
 ## Timeline
 
 - **Completed**: {timestamp}
-"""
+""",
+        ]
 
         if log_analysis:
             if log_analysis.get("duration"):
-                content += f"- **Duration**: {log_analysis['duration']}\n"
-            content += (
-                f"- **Total Prompts**: {log_analysis.get('total_prompts', 'Unknown')}\n"
+                parts.append(f"- **Duration**: {log_analysis['duration']}\n")
+            parts.append(
+                f"- **Total Prompts**: {log_analysis.get('total_prompts', 'Unknown')}\n",
             )
 
-        content += """
+        parts.append("""
 ## What Went Well
 
 <!-- Add items that worked well during this project -->
@@ -234,14 +238,16 @@ completed: {timestamp}
 ## Technical Decisions
 
 <!-- Document key technical decisions made during the project -->
-"""
+""")
 
         if log_analysis and log_analysis.get("commands_used"):
-            content += "\n## Commands Used\n\n"
-            for cmd, count in sorted(log_analysis["commands_used"].items()):
-                content += f"- `{cmd}`: {count} times\n"
+            parts.append("\n## Commands Used\n\n")
+            parts.extend(
+                f"- `{cmd}`: {count} times\n"
+                for cmd, count in sorted(log_analysis["commands_used"].items())
+            )
 
-        content += """
+        parts.append("""
 ## Follow-up Items
 
 <!-- List any follow-up work or related improvements -->
@@ -250,9 +256,9 @@ completed: {timestamp}
 ---
 
 _This retrospective was auto-generated by claude-spec plugin._
-"""
+""")
 
-        return content
+        return "".join(parts)
 
 
 def run(cwd: str, config: dict[str, Any] | None = None) -> StepResult:
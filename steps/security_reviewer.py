@@ -113,6 +113,7 @@ a chance to address security issues before marking a project complete.
 
 from __future__ import annotations
 
+import json
 import subprocess
 import sys
 from typing import Any
@@ -264,8 +265,6 @@ class SecurityReviewerStep(BaseStep):
             )
 
             if result.stdout:
-                import json
-
                 try:
                     report = json.loads(result.stdout)
                     for issue in report.get("results", []):
@@ -37,6 +37,14 @@ class TestLogAnalysis(unittest.TestCase):
         )
         self.assertEqual(analysis.duration_minutes(), 30.0)
 
+    def test_duration_minutes_zulu_timestamps(self):
+        """Should accept Z-suffixed timestamps."""
+        analysis = LogAnalysis(
+            first_entry_time="2025-01-01T10:00:00Z",
+            last_entry_time="2025-01-01T10:45:00Z",
+        )
+        self.assertEqual(analysis.duration_minutes(), 45.0)
+
     def test_duration_minutes_invalid_timestamps(self):
         """Should return None for invalid timestamps."""
         analysis = LogAnalysis(
@@ -95,6 +103,43 @@ class TestAnalyzeLog(unittest.TestCase):
         analysis = analyze_log(self.temp_dir)
         self.assertEqual(analysis.expanded_prompts, 1)
 
+    def test_session_stats_counts_per_session(self):
+        """Should compute every per-session counter from that session only."""
+        from filters.log_entry import FilterInfo
+
+        entries = [
+            ("s1", "user_input", "what next?", None),
+            ("s1", "user_input", "do it", FilterInfo(secret_count=1)),
+            ("s1", "expanded_prompt", "expanded?", None),
+            ("s1", "response_summary", "done", None),
+            ("s2", "user_input", "why?", None),
+        ]
+        for session_id, entry_type, content, filter_info in entries:
+            entry = LogEntry.create(
+                session_id=session_id,
+                entry_type=entry_type,
+                content=content,
+                filter_info=filter_info,
+            )
+            append_to_log(self.temp_dir, entry)
+
+        analysis = analyze_log(self.temp_dir)
+        stats = {s.session_id: s for s in analysis.session_stats}
+
+        s1 = stats["s1"]
+        self.assertEqual(s1.entry_count, 4)
+        self.assertEqual(s1.user_inputs, 2)
+        self.assertEqual(s1.expanded_prompts, 1)
+        self.assertEqual(s1.response_summaries, 1)
+        # Only user inputs count as questions
+        self.assertEqual(s1.questions_asked, 1)
+        self.assertEqual(s1.filtered_content, 1)
+
+        s2 = stats["s2"]
+        self.assertEqual(s2.entry_count, 1)
+        self.assertEqual(s2.questions_asked, 1)
+        self.assertEqual(s2.filtered_content, 0)
+
     def test_counts_response_summaries(self):
         """Should correctly count response summaries."""
         entry = LogEntry.create(
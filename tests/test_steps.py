@@ -68,6 +68,20 @@ class TestContextLoaderStep:
         assert "context" in result.data
         assert "Test Project" in result.data["context"]
 
+    def test_truncates_long_claude_md(self, tmp_path):
+        """Test oversized CLAUDE.md is cut at the local limit."""
+        from utils.context_utils import load_claude_md
+
+        (tmp_path / "CLAUDE.md").write_text("x" * 20 + "TAIL")
+        content = load_claude_md(
+            str(tmp_path),
+            local_limit=20,
+            truncate_indicator="...[truncated]",
+        )
+
+        assert content.endswith("x" * 20 + "...[truncated]")
+        assert "TAIL" not in content
+
     def test_loads_git_state(self, tmp_path):
         """Test loading git state."""
         import subprocess
@@ -93,6 +107,26 @@ class TestContextLoaderStep:
         assert "context" in result.data
         assert "Git State" in result.data["context"]
 
+    def test_git_state_reports_branch_and_changes(self, tmp_path):
+        """Test branch and changes are both read from a single status call."""
+        import subprocess
+
+        subprocess.run(
+            ["git", "init", "-b", "feature/x"],
+            cwd=tmp_path,
+            capture_output=True,
+            check=True,
+        )
+        (tmp_path / "untracked.txt").write_text("data")
+
+        step = ContextLoaderStep(str(tmp_path))
+        result = step.run()
+
+        context = result.data["context"]
+        assert "**Branch**: feature/x" in context
+        assert "**Uncommitted changes**: 1 files" in context
+        assert "?? untracked.txt" in context
+
     def test_loads_project_structure(self, tmp_path):
         """Test loading project structure."""
         (tmp_path / "src").mkdir()
@@ -299,6 +333,7 @@ class TestRetrospectiveGeneratorStep:
         content = retro.read_text()
         assert "Retrospective" in content
         assert "test-project" in content
+        assert "A test project for testing." in content
 
     def test_skips_if_exists(self, tmp_path):
         """Test skipping if RETROSPECTIVE.md already exists."""
@@ -1196,15 +1231,15 @@ class TestRetrospectiveGeneratorStepErrorPaths:
 
         step = RetrospectiveGeneratorStep(str(tmp_path))
 
-        # Mock Path.read_text to raise exception for README
-        original_read_text = Path.read_text
+        # Mock Path.open to raise exception for README
+        original_open = Path.open
 
-        def mock_read_text(self, *args, **kwargs):
+        def mock_open(self, *args, **kwargs):
             if "README.md" in str(self):
                 raise PermissionError("Permission denied")
-            return original_read_text(self, *args, **kwargs)
+            return original_open(self, *args, **kwargs)
 
-        monkeypatch.setattr(Path, "read_text", mock_read_text)
+        monkeypatch.setattr(Path, "open", mock_open)
 
         result = step.run()
 
@@ -44,6 +44,45 @@ def _log_error(prefix: str, message: str) -> None:
     sys.stderr.write(f"{prefix}: {message}\n")
 
 
+def _parse_branch_header(header: str) -> str:
+    """Extract the branch name from a ``git status --branch`` header line.
+
+    Args:
+        header: First line of ``git status --porcelain --branch`` output,
+            e.g. ``## main...origin/main [ahead 1]``
+
+    Returns:
+        Branch name, ``HEAD`` when detached, or empty string if unparseable
+    """
+    if not header.startswith("## "):
+        return ""
+
+    branch = header[3:]
+    if branch.startswith("No commits yet on "):
+        return branch[len("No commits yet on ") :]
+    if branch.startswith("HEAD (no branch)"):
+        return "HEAD"
+
+    return branch.partition("...")[0].partition(" ")[0]
+
+
+def _read_capped(path: Path, limit: int) -> str:
+    """Read at most ``limit + 1`` characters from a text file.
+
+    The extra character lets callers detect that the file was longer than
+    ``limit`` without reading the rest of it.
+
+    Args:
+        path: File to read
+        limit: Maximum number of characters the caller will keep
+
+    Returns:
+        Up to ``limit + 1`` characters of the file content
+    """
+    with path.open(encoding="utf-8") as f:
+        return f.read(limit + 1)
+
+
 def load_claude_md(
     cwd: str,
     log_prefix: str = "context_utils",
@@ -69,7 +108,7 @@ def load_claude_md(
     global_claude = Path.home() / ".claude" / "CLAUDE.md"
     if global_claude.is_file():
         try:
-            content = global_claude.read_text(encoding="utf-8")
+            content = _read_capped(global_claude, global_limit)
             if len(content) > global_limit:
                 content = content[:global_limit] + truncate_indicator
             parts.append(f"## Global CLAUDE.md\n\n{content}")
@@ -80,7 +119,7 @@ def load_claude_md(
     local_claude = Path(cwd) / "CLAUDE.md"
     if local_claude.is_file():
         try:
-            content = local_claude.read_text(encoding="utf-8")
+            content = _read_capped(local_claude, local_limit)
             if len(content) > local_limit:
                 content = content[:local_limit] + truncate_indicator
             parts.append(f"## Project CLAUDE.md\n\n{content}")
@@ -112,17 +151,22 @@ def load_git_state(
     parts = ["## Git State\n"]
 
     try:
-        # Current branch
-        result = subprocess.run(
-            ["git", "rev-parse", "--abbrev-ref", "HEAD"],
+        # Current branch and uncommitted changes in a single call: the
+        # --branch header line replaces a separate `git rev-parse` probe
+        status = subprocess.run(
+            ["git", "status", "--porcelain", "--branch"],
             cwd=cwd,
             capture_output=True,
             text=True,
             timeout=timeout,
             check=False,  # Handle return code manually
         )
-        if result.returncode == 0:
-            parts.append(f"**Branch**: {result.stdout.strip()}")
+        changes = ""
+        if status.returncode == 0:
+            header, _, changes = status.stdout.partition("\n")
+            branch = _parse_branch_header(header)
+            if branch:
+                parts.append(f"**Branch**: {branch}")
 
         # Recent commits (last 3)
         result = subprocess.run(
@@ -137,27 +181,25 @@ def load_git_state(
             parts.append(f"\n**Recent commits**:\n```\n{result.stdout.strip()}\n```")
 
         # Uncommitted changes summary
-        result = subprocess.run(
-            ["git", "status", "--porcelain"],
-            cwd=cwd,
-            capture_output=True,
-            text=True,
-            timeout=timeout,
-            check=False,  # Handle return code manually
-        )
-        if result.returncode == 0:
-            changes = result.stdout.strip()
+        if status.returncode == 0:
+            changes = changes.strip()
             if changes:
-                lines = changes.split("\n")
-                parts.append(f"\n**Uncommitted changes**: {len(lines)} files")
+                # Count and slice by newline offsets rather than splitting
+                # every line; large untracked trees can list thousands
+                line_count = changes.count("\n") + 1
+                parts.append(f"\n**Uncommitted changes**: {line_count} files")
 
                 if include_changes_detail:
-                    if len(lines) <= max_change_lines:
+                    if line_count <= max_change_lines:
                         parts.append(f"```\n{changes}\n```")
                     else:
+                        end = 0
+                        for _ in range(max_change_lines):
+                            end = changes.index("\n", end) + 1
+                        shown = changes[: end - 1] if end else ""
                         parts.append(
-                            f"```\n{chr(10).join(lines[:max_change_lines])}\n"
-                            f"... and {len(lines) - max_change_lines} more\n```",
+                            f"```\n{shown}\n"
+                            f"... and {line_count - max_change_lines} more\n```",
                         )
             else:
                 parts.append("\n**Working tree**: clean")